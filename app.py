@@ -1,21 +1,54 @@
 import os
-import uuid
+import json
+import logging
+import time
+import string
+import hashlib
+import tempfile
+from datetime import datetime, timedelta
+import orjson
 import requests
-from flask import Flask, render_template, request, redirect, url_for, flash, jsonify
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, wraps
+from flask import Flask, Request, Response, abort, g, render_template, request, redirect, url_for, flash
+from flask.json.provider import JSONProvider
 from flask_login import LoginManager, login_user, login_required, logout_user, current_user
 from werkzeug.security import generate_password_hash, check_password_hash
-from werkzeug.utils import secure_filename
 from flask_cors import CORS
-from supabase import create_client, Client
-from gotrue.errors import AuthApiError
+from flask_caching import Cache
+from flask_compress import Compress
+from sqlalchemy import delete, event, select, text, union, update
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session, load_only, raiseload
 from dotenv import load_dotenv
-from models import db, User, About, Skill, Education, Experience, Project, Research, ContactMessage, Achievement, Blog, DailyUpdate
+from models import db, User, About, Skill, Education, Experience, Project, Research, ContactMessage, Achievement, Blog, DailyUpdate, SystemFlag
 
 # Load environment variables from .env file
 load_dotenv()
 
+logging.basicConfig(level=os.getenv('LOG_LEVEL', 'INFO'), format='%(asctime)s %(levelname)s %(name)s: %(message)s')
+logger = logging.getLogger(__name__)
+
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider backed by orjson's native encoder."""
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=orjson.OPT_NAIVE_UTC).decode()
+
+    def loads(self, s, **kwargs):
+        # orjson has no object_hook, which the session serializer relies on
+        # to restore tagged values (e.g. flashed message tuples)
+        if kwargs:
+            return json.loads(s, **kwargs)
+        return orjson.loads(s)
+
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 app.config['SECRET_KEY'] = os.getenv('SECRET_KEY', 'default-dev-key')
+# Multipart files are spooled to disk as they arrive (see UploadRequest), so
+# cap the body size; larger requests are rejected with 413
+app.config['MAX_CONTENT_LENGTH'] = int(os.getenv('MAX_UPLOAD_MB', 16)) * 1024 * 1024
 
 # ==========================================
 #  SUPABASE CONFIGURATION
@@ -28,10 +61,34 @@ if uri and uri.startswith("postgres://"):
 
 app.config['SQLALCHEMY_DATABASE_URI'] = uri
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
-app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
-    "pool_pre_ping": True, 
-    "pool_recycle": 300
+
+# Supabase's transaction pooler (PgBouncer) listens on 6543 and keeps its own
+# server connections healthy, so the per-checkout "SELECT 1" ping is only
+# worth paying on direct connections (5432).
+engine_options = {
+    "pool_recycle": 1800,
+    "pool_pre_ping": True
 }
+if uri and uri.startswith("postgresql"):
+    db_url = make_url(uri)
+    # Sized QueuePool (SQLite's StaticPool/NullPool take no sizing arguments)
+    engine_options["pool_size"] = 10
+    engine_options["max_overflow"] = 20
+    engine_options["pool_timeout"] = 30
+    engine_options["pool_pre_ping"] = db_url.port != 6543
+    # Route multi-row INSERT/UPDATE through psycopg2's execute_values/execute_batch
+    engine_options["executemany_mode"] = "values_plus_batch"
+    engine_options["insertmanyvalues_page_size"] = 1000
+    engine_options["executemany_batch_page_size"] = 500
+    engine_options["connect_args"] = {}
+    if 'sslmode' not in db_url.query:
+        # Supabase needs TLS; a URL that sets sslmode itself (e.g. local Postgres) keeps it
+        engine_options["connect_args"]["sslmode"] = "require"
+    if db_url.port != 6543:
+        # PgBouncer in transaction mode rejects startup parameters
+        engine_options["connect_args"]["options"] = "-c statement_timeout=5000"
+
+app.config['SQLALCHEMY_ENGINE_OPTIONS'] = engine_options
 
 # 2. Supabase API Credentials
 SUPABASE_URL = os.getenv('SUPABASE_URL')
@@ -40,12 +97,42 @@ SUPABASE_KEY = os.getenv('SUPABASE_KEY')
 if not SUPABASE_URL or not SUPABASE_KEY:
     raise ValueError("Missing SUPABASE_URL or SUPABASE_KEY in .env file")
 
-# Initialize Supabase Client
-supabase: Client = create_client(SUPABASE_URL, SUPABASE_KEY)
+# Supabase Client (created on first use; importing the SDK and setting up
+# its HTTP clients is a large share of cold-start time)
+@lru_cache(maxsize=1)
+def get_supabase():
+    from supabase import create_client
+    return create_client(SUPABASE_URL, SUPABASE_KEY)
 
 # Storage Bucket Name
 STORAGE_BUCKET = "portfolio"
 
+# Storage REST endpoints (object paths are appended to these)
+STORAGE_OBJECT_URL = f"{SUPABASE_URL}/storage/v1/object/{STORAGE_BUCKET}/"
+STORAGE_PUBLIC_URL = f"{SUPABASE_URL}/storage/v1/object/public/{STORAGE_BUCKET}/"
+
+# 3. Response Cache (Redis when configured, in-process otherwise)
+# Routes invalidate cached entries after each write, but without REDIS_URL
+# every gunicorn worker keeps its own SimpleCache and a delete only reaches the
+# worker that served the edit. There, the timeouts (API_CACHE_TIMEOUT and the
+# 60s memoized helpers) are the only freshness guarantee across workers.
+REDIS_URL = os.getenv('REDIS_URL')
+cache = Cache(app, config={
+    "CACHE_TYPE": "RedisCache" if REDIS_URL else "SimpleCache",
+    "CACHE_REDIS_URL": REDIS_URL,
+    "CACHE_DEFAULT_TIMEOUT": 300
+})
+
+# Public API bodies are invalidated by the CRUD routes, but rows edited outside
+# the app (e.g. in the Supabase table editor) are only picked up on expiry
+API_CACHE_TIMEOUT = int(os.getenv('API_CACHE_TIMEOUT', 60))
+
+# 4. Response Compression (JSON API bodies; brotli preferred over gzip)
+app.config['COMPRESS_MIMETYPES'] = ['application/json']
+app.config['COMPRESS_MIN_SIZE'] = 500
+app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+Compress(app)
+
 # ==========================================
 
 CORS(app)
@@ -55,110 +142,409 @@ login_manager = LoginManager()
 login_manager.login_view = 'login'
 login_manager.init_app(app)
 
+# Shared pool for fanning out independent dashboard queries
+dashboard_executor = ThreadPoolExecutor(max_workers=10)
+
+def run_in_app_context(query):
+    # Each worker pushes its own app context, so it gets its own scoped session
+    # (sessions are not thread-safe; the engine's connection pool is).
+    with app.app_context():
+        return query()
+
+def json_response(data, status=200):
+    return Response(orjson.dumps(data, option=orjson.OPT_NAIVE_UTC), status=status, mimetype='application/json')
+
+def cached_api(key):
+    """Serves a public GET endpoint from the cache, answering If-None-Match with 304.
+
+    Responses are marked public so a CDN or browser can serve repeats without
+    reaching the app, revalidating against the ETag once they are older than
+    API_CACHE_TIMEOUT: clients never trust a body longer than the server does.
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            cached = cache.get(key)
+            if cached is None:
+                body = orjson.dumps(view(*args, **kwargs), option=orjson.OPT_NAIVE_UTC)
+                cached = (body, hashlib.blake2b(body, digest_size=8).hexdigest())
+                cache.set(key, cached, timeout=API_CACHE_TIMEOUT)
+            body, etag = cached
+            response = Response(body, mimetype='application/json')
+            response.set_etag(etag)
+            response.headers['Cache-Control'] = f"public, max-age={API_CACHE_TIMEOUT}"
+            # Compressed bodies go out with an encoding-tagged ETag ("<tag>:br"),
+            # so match revalidations on the tag itself as well
+            if etag in {tag.partition(':')[0] for tag in request.if_none_match.as_set()}:
+                response.status_code = 304
+                response.set_data(b'')
+                return response
+            return response.make_conditional(request)
+        return wrapper
+    return decorator
+
+def fetch_rows(model, fields, order_by=None, limit=None):
+    """Selects the named columns as plain dicts, skipping ORM instance construction."""
+    stmt = select(*(getattr(model, field) for field in fields))
+    if order_by is not None:
+        stmt = stmt.order_by(order_by)
+    if limit is not None:
+        stmt = stmt.limit(limit)
+    return [dict(zip(fields, row)) for row in db.session.execute(stmt)]
+
+@cache.memoize(timeout=60)
+def load_image_history():
+    """Sorted, de-duplicated image URLs already in use, offered as dashboard picks."""
+    stmt = union(*(
+        select(column).where(column.is_not(None), column != '')
+        for column in (About.profile_image, About.mini_profile_image, Project.image_url)
+    ))
+    return db.session.scalars(stmt.order_by(stmt.selected_columns[0])).all()
+
+@cache.memoize(timeout=60)
+def about_id():
+    """Primary key of the singleton About row."""
+    return db.session.scalar(select(About.id).limit(1))
+
+def load_about():
+    """The About row, fetched once per request by primary key."""
+    if 'about' not in g:
+        pk = about_id()
+        g.about = db.session.get(About, pk) if pk is not None else None
+    return g.about
+
 @login_manager.user_loader
 def load_user(user_id):
     return User.query.get(int(user_id))
 
+# Upload types we accept, with the MIME type to use when the browser sends none
+EXTENSION_MIME_TYPES = {
+    '.png': 'image/png',
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.gif': 'image/gif',
+    '.pdf': 'application/pdf',
+    '.webp': 'image/webp'
+}
+ALLOWED_EXTENSIONS = frozenset(EXTENSION_MIME_TYPES)
+
 def allowed_file(filename):
-    return '.' in filename and \
-           filename.rsplit('.', 1)[1].lower() in {'png', 'jpg', 'jpeg', 'gif', 'pdf', 'webp'}
+    i = filename.rfind('.')
+    return i >= 0 and filename[i:].lower() in ALLOWED_EXTENSIONS
 
 # --- SUPABASE UPLOAD HELPER ---
+SAFE_FILENAME_CHARS = frozenset(string.ascii_letters + string.digits + '._-')
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+class UploadSpool:
+    """Disk-backed upload target that hashes bytes as the form parser writes them."""
+    def __init__(self):
+        self.file = tempfile.NamedTemporaryFile(delete=False)
+        self.digest = hashlib.blake2b(digest_size=16)
+        self.claimed = False
+
+    def write(self, data):
+        self.digest.update(data)
+        return self.file.write(data)
+
+    def __getattr__(self, attr):
+        return getattr(self.file, attr)
+
+class UploadRequest(Request):
+    """Streams multipart files straight into an UploadSpool.
+
+    Werkzeug would otherwise buffer each file in a SpooledTemporaryFile (RAM,
+    then /tmp past 500 KB) which handle_file_upload then copied to disk again.
+    """
+    def _get_file_stream(self, total_content_length, content_type, filename=None, content_length=None):
+        spool = UploadSpool()
+        self.__dict__.setdefault('upload_spools', []).append(spool)
+        return spool
+
+app.request_class = UploadRequest
+
+@app.teardown_request
+def remove_unclaimed_spools(exc):
+    # Files that no route handed to the uploader (e.g. empty file inputs)
+    for spool in getattr(request, 'upload_spools', ()):
+        if not spool.claimed:
+            spool.close()
+            os.remove(spool.name)
+    # Uploads whose row was never saved (e.g. an edit that hit a 404)
+    for tmp_path, file_path, content_type in g.pop('pending_uploads', {}).values():
+        os.remove(tmp_path)
+
+# Uploads run in the background so admin forms only wait for the DB commit
+upload_executor = ThreadPoolExecutor(max_workers=8)
+
+# One keep-alive session for Storage, so uploads reuse TCP+TLS connections
+# instead of handshaking on every request
+storage_http = requests.Session()
+storage_http.headers.update({
+    "Authorization": f"Bearer {SUPABASE_KEY}",
+    "apikey": SUPABASE_KEY
+})
+storage_http.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=20))
+
+def upload_to_storage(tmp_path, file_path, content_type, model, id, previous, attempts=3):
+    """Streams a spooled upload to Supabase Storage, retrying with exponential backoff.
+
+    model/id name the row the route saved the URL into, and previous maps the
+    fields holding it to their values before the request; those are put back
+    if the upload gives up.
+    """
+    try:
+        # Paths are content-addressed: if the object exists, it already holds these bytes
+        missing = False
+        try:
+            status = storage_http.head(STORAGE_PUBLIC_URL + file_path).status_code
+            if status == 200:
+                logger.info("upload skipped, already stored path=%s", file_path)
+                return True
+            # A 5xx says nothing about the object, only that Storage is unwell
+            missing = status < 500
+        except Exception as e:
+            logger.warning("upload existence check failed path=%s error=%s", file_path, e)
+
+        for attempt in range(attempts):
+            try:
+                with open(tmp_path, 'rb') as body:
+                    # Stream from disk straight into the Storage REST API so the
+                    # file is never held in memory as a single bytes object.
+                    res = storage_http.post(
+                        STORAGE_OBJECT_URL + file_path,
+                        data=body,
+                        headers={
+                            "Content-Type": content_type,
+                            # Same path means same bytes, so overwriting is harmless
+                            # and keeps retries idempotent
+                            "x-upsert": "true"
+                        }
+                    )
+                res.raise_for_status()
+                logger.info("upload done path=%s", file_path)
+                return True
+            except Exception as e:
+                logger.warning("upload failed path=%s attempt=%d/%d error=%s", file_path, attempt + 1, attempts, e)
+                if attempt + 1 < attempts:
+                    time.sleep(2 ** attempt)
+        # If the existence check failed too, the object may well be stored
+        # already (other rows share content-addressed paths): keep the URL
+        if missing:
+            revert_failed_upload(STORAGE_PUBLIC_URL + file_path, model, id, previous)
+        return False
+    finally:
+        os.remove(tmp_path)
+
+# API cache key fed by each model that stores uploaded file URLs
+UPLOAD_CACHE_KEYS = {
+    About: 'api_about',
+    Skill: 'api_skills',
+    Education: 'api_education',
+    Project: 'api_projects',
+    Research: 'api_research',
+    Blog: 'api_blogs'
+}
+
+def revert_failed_upload(url, model, id, previous):
+    """Puts back what a row held before a URL whose upload has given up was saved.
+
+    Only the row the upload was made for is touched, and only where it still
+    holds this URL: other rows may share the content-addressed path.
+    """
+    with app.app_context():
+        reverted = 0
+        for field, value in previous.items():
+            column = getattr(model, field)
+            result = db.session.execute(
+                update(model).where(model.id == id, column == url).values({column: value})
+            )
+            reverted += result.rowcount
+        db.session.commit()
+        if reverted:
+            cache.delete(UPLOAD_CACHE_KEYS[model])
+            cache.delete_memoized(load_image_history)
+            logger.warning("upload abandoned, reverted saved row model=%s id=%s url=%s", model.__name__, id, url)
+
 def handle_file_upload(file, subfolder='others'):
     if not file or file.filename == '':
         return None
 
-    original_filename = secure_filename(file.filename)
-    unique_filename = f"{uuid.uuid4().hex[:8]}_{original_filename}"
-    file_path = f"{subfolder}/{unique_filename}"
-    
-    content_type = file.content_type or 'application/octet-stream'
+    # Keep only characters that are safe in a storage key
+    original_filename = ''.join(c for c in file.filename if c in SAFE_FILENAME_CHARS)[:80] or 'file'
+    extension = os.path.splitext(original_filename)[1].lower()
+    content_type = file.content_type or EXTENSION_MIME_TYPES.get(extension, 'application/octet-stream')
+
+    if isinstance(file.stream, UploadSpool):
+        # Already on disk and hashed by the form parser: hand it over as-is
+        spool = file.stream
+        spool.claimed = True
+        spool.close()
+        tmp_path, digest = spool.name, spool.digest
+    else:
+        try:
+            # The request's file is closed once the response is sent, so hand the
+            # background worker its own copy on disk, hashing it on the way through.
+            digest = hashlib.blake2b(digest_size=16)
+            with tempfile.NamedTemporaryFile(delete=False) as tmp:
+                for chunk in iter(lambda: file.stream.read(UPLOAD_CHUNK_SIZE), b''):
+                    digest.update(chunk)
+                    tmp.write(chunk)
+            tmp_path = tmp.name
+        except Exception:
+            logger.exception("upload spool failed filename=%s", original_filename)
+            return None
+
+    # Content-addressed path: the same file always maps to the same object
+    file_path = f"{subfolder}/{digest.hexdigest()}{extension}"
+
+    logger.debug("upload spooled filename=%s path=%s ct=%s", original_filename, file_path, content_type)
+
+    # Public URLs are deterministic, so the row can be saved before the upload lands.
+    # The upload itself starts once the route knows which row holds the URL.
+    url = STORAGE_PUBLIC_URL + file_path
+    pending = g.setdefault('pending_uploads', {})
+    if url in pending:
+        # Same bytes sent twice in one form (e.g. main and mini profile image)
+        os.remove(tmp_path)
+    else:
+        pending[url] = (tmp_path, file_path, content_type)
+    return url
+
+def start_uploads(model, id, values, previous=None):
+    """Hands the request's spooled files to the uploader, once their row is saved.
+
+    values maps the row's fields to what was written and previous (None for a
+    new row) to what they held before, so a failed upload can revert exactly
+    the fields that hold its URL.
+    """
+    previous = previous or {}
+    for url, (tmp_path, file_path, content_type) in g.pop('pending_uploads', {}).items():
+        restore = {field: previous.get(field) for field, value in values.items() if value == url}
+        logger.debug("upload start path=%s row=%s/%s", file_path, model.__name__, id)
+        upload_executor.submit(upload_to_storage, tmp_path, file_path, content_type, model, id, restore)
 
-    print(f"⚡ Attempting to upload: {original_filename} to {file_path}...")
+# --- SETUP / INIT ---
+BOOTSTRAP_FLAG = 'bootstrap_done'
 
+def is_bootstrapped():
+    """Single-query check for the sentinel row written by a finished bootstrap."""
     try:
-        file_content = file.read()
-        res = supabase.storage.from_(STORAGE_BUCKET).upload(
-            file=file_content,
-            path=file_path,
-            file_options={"content-type": content_type, "x-upsert": "false"}
-        )
-        public_url_response = supabase.storage.from_(STORAGE_BUCKET).get_public_url(file_path)
-        
-        print(f"✅ Upload Successful! URL: {public_url_response}")
-        return public_url_response
-    except Exception as e:
-        print(f"❌ Supabase Upload Failed: {e}")
-        return None
-    finally:
-        file.seek(0)
+        return db.session.get(SystemFlag, BOOTSTRAP_FLAG) is not None
+    except SQLAlchemyError:
+        # Fresh database: the flag table does not exist yet
+        db.session.rollback()
+        return False
 
-# --- SETUP / INIT ---
 @app.cli.command("create-admin")
 def create_admin():
     """Creates tables and registers admin in Supabase Auth."""
     with app.app_context():
         try:
+            if is_bootstrapped():
+                print("Local DB: already bootstrapped, nothing to do.")
+                return
+
             db.create_all()
             
             default_email = 'admin@example.com'
             default_password = 'admin123' # Min 6 chars for Supabase
 
             # 1. Register in Supabase Auth
+            from gotrue.errors import AuthApiError
+
+            registered = False
             try:
-                res = supabase.auth.sign_up({
+                res = get_supabase().auth.sign_up({
                     "email": default_email,
                     "password": default_password
                 })
+                registered = True
                 print(f"Supabase Auth: User created/fetched for {default_email}")
+            except AuthApiError as e:
+                registered = 'already registered' in (e.message or '').lower()
+                print(f"Supabase Auth Note: {e.message}")
             except Exception as e:
-                print(f"Supabase Auth Note: {e} (User likely already exists)")
+                print(f"Supabase Auth Error: {e}")
 
             # 2. Ensure Local DB Record exists (for Flask-Login session mapping)
+            seed_rows = []
             if not User.query.filter_by(email=default_email).first():
-                new_user = User(email=default_email, password="handled_by_supabase")
-                db.session.add(new_user)
-                db.session.commit()
-                print("Local DB: Admin user record created.")
+                seed_rows.append(User(email=default_email, password="handled_by_supabase"))
             
             # Ensure 'About' exists
             if not About.query.first():
-                db.session.add(About(name="Your Name"))
-                db.session.commit()
+                seed_rows.append(About(name="Your Name"))
+
+            # Write the seed rows and, once the admin is known to Supabase, the
+            # sentinel in one transaction; otherwise the next run retries sign-up
+            seed_count = len(seed_rows)
+            if registered:
+                seed_rows.append(SystemFlag(key=BOOTSTRAP_FLAG, value='1'))
+
+            db.session.bulk_save_objects(seed_rows)
+            db.session.commit()
+            cache.delete_memoized(about_id)
+            print(f"Local DB: {seed_count} seed record(s) created.")
+            if not registered:
+                print("Bootstrap not marked done: run create-admin again once Supabase sign-up works.")
 
         except Exception as e:
             print(f"Error: {e}")
 
 # --- AUTH ROUTES ---
+
+# How long a password Supabase accepted may be checked locally before Supabase is
+# asked again (so a changed password or a disabled account takes effect within it)
+PASSWORD_CACHE_TTL = timedelta(minutes=int(os.getenv('PASSWORD_CACHE_MINUTES', 60)))
+
 @app.route('/login', methods=['GET', 'POST'])
 def login():
     if request.method == 'POST':
         email = request.form.get('email')
         password = request.form.get('password')
+
+        if not email or not password:
+            flash("Login failed: email and password are required.")
+            return render_template('login.html')
         
+        # 0. Fast path: verify against the hash cached by a recent Supabase login
+        user = User.query.filter_by(email=email).first()
+        if (user and user.password_hash and user.password_verified_at
+                and datetime.utcnow() - user.password_verified_at < PASSWORD_CACHE_TTL
+                and check_password_hash(user.password_hash, password)):
+            login_user(user)
+            return redirect(url_for('dashboard'))
+
+        from gotrue.errors import AuthApiError
+
         try:
             # 1. Authenticate with Supabase
-            auth_response = supabase.auth.sign_in_with_password({
+            auth_response = get_supabase().auth.sign_in_with_password({
                 "email": email,
                 "password": password
             })
             
             # 2. If successful, Supabase returns a user/session
             if auth_response.user:
-                # 3. Find corresponding local user for Flask-Login session
-                user = User.query.filter_by(email=email).first()
-                
-                # Create local record if missing (sync)
+                # 3. Create local record if missing (sync) and cache the verified password
                 if not user:
                     user = User(email=email, password="handled_by_supabase")
                     db.session.add(user)
-                    db.session.commit()
+                user.password_hash = generate_password_hash(password)
+                user.password_verified_at = datetime.utcnow()
+                db.session.commit()
                 
                 # Log in via Flask-Login
                 login_user(user)
                 return redirect(url_for('dashboard'))
                 
         except AuthApiError as e:
+            # Supabase is the authority: drop whatever was cached for this account
+            if user and user.password_hash:
+                user.password_hash = None
+                user.password_verified_at = None
+                db.session.commit()
             flash(f"Login failed: {e.message}")
         except Exception as e:
             flash("An unexpected error occurred. Check console.")
@@ -169,56 +555,190 @@ def login():
 @app.route('/logout')
 @login_required
 def logout():
-    try:
-        supabase.auth.sign_out()
-    except:
-        pass
+    # Only a client that was actually created can hold a Supabase session
+    if get_supabase.cache_info().currsize:
+        try:
+            get_supabase().auth.sign_out()
+        except:
+            pass
     logout_user()
     return redirect(url_for('login'))
 
 # --- ADMIN DASHBOARD ROUTES ---
+
+# About columns the dashboard form actually renders
+DASHBOARD_ABOUT_FIELDS = tuple(field for field in About.API_FIELDS if field != 'age')
+
+# The whole dashboard as one JSON document, assembled by Postgres in a single round-trip
+DASHBOARD_SQL = text(f"""
+    SELECT json_build_object(
+        'about', (SELECT row_to_json(a) FROM (
+            SELECT {', '.join(DASHBOARD_ABOUT_FIELDS)} FROM about ORDER BY id LIMIT 1
+        ) a),
+        'skills', COALESCE((SELECT json_agg(s) FROM skill s), '[]'::json),
+        'education', COALESCE((SELECT json_agg(e) FROM education e), '[]'::json),
+        'experience', COALESCE((SELECT json_agg(x) FROM experience x), '[]'::json),
+        'projects', COALESCE((SELECT json_agg(p) FROM project p), '[]'::json),
+        'researches', COALESCE((SELECT json_agg(r) FROM research r), '[]'::json),
+        'achievements', COALESCE((SELECT json_agg(ac) FROM achievement ac), '[]'::json),
+        'blogs', COALESCE((SELECT json_agg(b) FROM blog b), '[]'::json),
+        'daily_updates', COALESCE((SELECT json_agg(d ORDER BY d.id DESC) FROM daily_update d), '[]'::json),
+        'messages', COALESCE((SELECT json_agg(m ORDER BY m.timestamp DESC) FROM contact_message m), '[]'::json),
+        'unread_count', (SELECT count(*) FROM contact_message WHERE read = false)
+    )
+""")
+
+# The landing page tolerates a few seconds of staleness, so the aggregated
+# payload is kept as a short-lived snapshot, dropped by any commit that wrote
+# rows (one cache DELETE per such commit, public contact posts included).
+# Only with Redis: SimpleCache is per worker, so a drop in the worker that
+# committed would leave the other workers' snapshots stale.
+DASHBOARD_SNAPSHOT_ENABLED = bool(REDIS_URL)
+DASHBOARD_SNAPSHOT_KEY = 'dashboard_snapshot'
+DASHBOARD_SNAPSHOT_TIMEOUT = int(os.getenv('DASHBOARD_SNAPSHOT_TIMEOUT', 5))
+
+if DASHBOARD_SNAPSHOT_ENABLED:
+    @event.listens_for(Session, 'after_flush')
+    def mark_dashboard_stale(session, flush_context):
+        session.info['dashboard_stale'] = True
+
+    @event.listens_for(Session, 'do_orm_execute')
+    def mark_dashboard_stale_on_bulk_write(orm_execute_state):
+        # update_by_id/delete_by_id write with statements, which never flush
+        if orm_execute_state.is_update or orm_execute_state.is_delete or orm_execute_state.is_insert:
+            orm_execute_state.session.info['dashboard_stale'] = True
+
+    @event.listens_for(Session, 'after_commit')
+    def drop_dashboard_snapshot(session):
+        if session.info.pop('dashboard_stale', False):
+            cache.delete(DASHBOARD_SNAPSHOT_KEY)
+
+    @event.listens_for(Session, 'after_rollback')
+    def forget_dashboard_writes(session):
+        session.info.pop('dashboard_stale', None)
+
+def load_dashboard_payload():
+    if DASHBOARD_SNAPSHOT_ENABLED:
+        data = cache.get(DASHBOARD_SNAPSHOT_KEY)
+        if data is not None:
+            return data
+
+    # image_history is usually a cache hit; on a miss, keep its query on the
+    # wire alongside the payload instead of paying a second round-trip after it
+    image_history = dashboard_executor.submit(run_in_app_context, load_image_history)
+
+    data = db.session.execute(DASHBOARD_SQL).scalar()
+    # JSON has no datetime type; the template formats message timestamps
+    for m in data['messages']:
+        if m['timestamp']:
+            m['timestamp'] = datetime.fromisoformat(m['timestamp'])
+    data['image_history'] = image_history.result()
+    if DASHBOARD_SNAPSHOT_ENABLED:
+        cache.set(DASHBOARD_SNAPSHOT_KEY, data, timeout=DASHBOARD_SNAPSHOT_TIMEOUT)
+    return data
+
+def load_dashboard_about():
+    pk = about_id()
+    if pk is None:
+        return None
+    return db.session.get(About, pk, options=[
+        load_only(*(getattr(About, field) for field in DASHBOARD_ABOUT_FIELDS))
+    ])
+
+def load_all(model, *order_by):
+    # raiseload('*'): relationships the template needs must be eager-loaded here,
+    # so an accidental lazy load fails loudly instead of adding a query per row
+    return db.session.scalars(select(model).options(raiseload('*')).order_by(*order_by)).all()
+
+def load_dashboard_concurrently():
+    queries = {
+        'about': load_dashboard_about,
+        'skills': lambda: load_all(Skill),
+        'education': lambda: load_all(Education),
+        'experience': lambda: load_all(Experience),
+        'projects': lambda: load_all(Project),
+        'researches': lambda: load_all(Research),
+        'achievements': lambda: load_all(Achievement),
+        'blogs': lambda: load_all(Blog),
+        'daily_updates': lambda: load_all(DailyUpdate, DailyUpdate.id.desc()),
+        'messages': lambda: load_all(ContactMessage, ContactMessage.timestamp.desc()),
+        'image_history': load_image_history,
+    }
+
+    # Fire every query at once: wall time is max(query) instead of sum(query)
+    futures = {name: dashboard_executor.submit(run_in_app_context, query) for name, query in queries.items()}
+    data = {name: future.result() for name, future in futures.items()}
+
+    # Every message is already in memory; counting here saves a round-trip
+    data['unread_count'] = sum(1 for m in data['messages'] if not m.read)
+    return data
+
 @app.route('/')
 @app.route('/dashboard')
 @login_required
 def dashboard():
     active_tab = request.args.get('tab', 'messages')
     
-    about = About.query.first()
-    skills = Skill.query.all()
-    education = Education.query.all()
-    experience = Experience.query.all()
-    projects = Project.query.all()
-    researches = Research.query.all()
-    achievements = Achievement.query.all() 
-    blogs = Blog.query.all()  
-    daily_updates = DailyUpdate.query.order_by(DailyUpdate.id.desc()).all() # Added
-    
-    messages = ContactMessage.query.order_by(ContactMessage.timestamp.desc()).all()
-    unread_count = ContactMessage.query.filter_by(read=False).count()
+    # json_build_object is Postgres-only; other databases (local SQLite) fan out instead
+    if db.engine.dialect.name == 'postgresql':
+        data = load_dashboard_payload()
+    else:
+        data = load_dashboard_concurrently()
 
-    image_history = set()
-    if about:
-        if about.profile_image: image_history.add(about.profile_image)
-        if about.mini_profile_image: image_history.add(about.mini_profile_image)
-        
-    for p in projects:
-        if p.image_url: image_history.add(p.image_url)
-    
-    image_history = sorted(list(filter(None, image_history)))
-    
     return render_template('dashboard.html', 
-                           about=about, skills=skills, education=education, 
-                           experience=experience, projects=projects, 
-                           researches=researches, achievements=achievements,
-                           blogs=blogs,
-                           daily_updates=daily_updates,
-                           messages=messages,
-                           unread_count=unread_count,
                            active_tab=active_tab,
-                           image_history=image_history)
+                           **data)
 
 # --- API ROUTES ---
 
+# Unread message counter, kept in Redis and adjusted as messages arrive / are read.
+# It is stored raw through the Redis client: cachelib pickles every cached
+# value, which INCRBY cannot work on. Without Redis each worker would keep its
+# own count, so the count always comes from the database instead.
+UNREAD_COUNT_KEY = 'unread_messages'
+UNREAD_COUNT_TIMEOUT = 300
+
+# Adjusts the counter only if it exists, in one atomic step; a missing one is
+# recounted on next read. INCRBY keeps the key's TTL, so it still re-syncs.
+INCR_IF_EXISTS = """
+if redis.call('EXISTS', KEYS[1]) == 1 then
+    return redis.call('INCRBY', KEYS[1], ARGV[1])
+end
+return false
+"""
+
+@lru_cache(maxsize=1)
+def get_counter_redis():
+    """Raw Redis client for counters (None without REDIS_URL)."""
+    if not REDIS_URL:
+        return None
+    import redis
+    return redis.Redis.from_url(REDIS_URL)
+
+def count_unread():
+    return ContactMessage.query.filter_by(read=False).count()
+
+def seed_unread_count():
+    count = count_unread()
+    get_counter_redis().set(UNREAD_COUNT_KEY, count, ex=UNREAD_COUNT_TIMEOUT)
+    return count
+
+def unread_count():
+    client = get_counter_redis()
+    if client is None:
+        return count_unread()
+    count = client.get(UNREAD_COUNT_KEY)
+    if count is None:
+        count = count_unread()
+        # nx: keep a counter another request seeded meanwhile
+        client.set(UNREAD_COUNT_KEY, count, ex=UNREAD_COUNT_TIMEOUT, nx=True)
+    return int(count)
+
+def adjust_unread_count(delta):
+    client = get_counter_redis()
+    if client is not None:
+        client.eval(INCR_IF_EXISTS, 1, UNREAD_COUNT_KEY, delta)
+
 @app.route('/api/message/read/<int:id>', methods=['POST'])
 @login_required
 def mark_message_read(id):
@@ -226,155 +746,156 @@ def mark_message_read(id):
     if not msg.read:
         msg.read = True
         db.session.commit()
-    new_count = ContactMessage.query.filter_by(read=False).count()
-    return jsonify({'success': True, 'unread_count': new_count})
+        adjust_unread_count(-1)
+    return json_response({'success': True, 'unread_count': unread_count()})
 
 # --- CRUD ROUTES ---
 
+# Form fields each edit route writes verbatim
+SKILL_FIELDS = ('name', 'percentage')
+EDUCATION_FIELDS = ('degree', 'institution', 'year_range', 'description')
+EXPERIENCE_FIELDS = ('role', 'company', 'year_range', 'description')
+PROJECT_FIELDS = ('title', 'category', 'project_link')
+RESEARCH_FIELDS = ('title', 'publication_date', 'link', 'description')
+ACHIEVEMENT_FIELDS = ('title', 'description', 'date', 'link')
+BLOG_FIELDS = ('title', 'content', 'tags', 'date')
+DAILY_UPDATE_FIELDS = ('title', 'date', 'description')
+
+def update_by_id(model, id, values, tab, cache_key, message):
+    """Updates a row with a single UPDATE statement (404 if it does not exist).
+
+    Files bound into values are only uploaded once the UPDATE has matched the
+    row, so an edit of a missing row never leaves an orphan object in Storage.
+    """
+    previous = None
+    pending = g.get('pending_uploads')
+    if pending:
+        # Remember what the upload fields held, for a failed upload to put back
+        fields = [field for field, value in values.items() if value in pending]
+        row = db.session.execute(
+            select(*(getattr(model, field) for field in fields)).where(model.id == id)
+        ).first()
+        if row is None:
+            abort(404)
+        previous = dict(zip(fields, row))
+    result = db.session.execute(update(model).where(model.id == id).values(**values))
+    if result.rowcount == 0:
+        db.session.rollback()
+        abort(404)
+    db.session.commit()
+    start_uploads(model, id, values, previous)
+    cache.delete(cache_key)
+    flash(message)
+    return redirect(url_for('dashboard', tab=tab))
+
+def bind_upload(values, field, file_key, subfolder, form_key=None):
+    """Sets values[field] from an uploaded file, or from a URL typed into the form.
+
+    An uploaded file wins over the typed URL; with neither, values is left as is.
+    """
+    if form_key and request.form.get(form_key):
+        values[field] = request.form[form_key]
+    if file_key in request.files:
+        url = handle_file_upload(request.files[file_key], subfolder=subfolder)
+        if url:
+            values[field] = url
+    return values
+
+def delete_by_id(model, id, tab, cache_key):
+    """Deletes a row with a single DELETE statement and returns to its dashboard tab."""
+    db.session.execute(
+        delete(model).where(model.id == id).execution_options(synchronize_session=False)
+    )
+    db.session.commit()
+    cache.delete(cache_key)
+    return redirect(url_for('dashboard', tab=tab))
+
+# About columns assigned verbatim from the update form
+ABOUT_FORM_FIELDS = tuple(field for field in About.API_FIELDS if field not in About.UPLOAD_FIELDS)
+
 @app.route('/update/about', methods=['POST'])
 @login_required
 def update_about():
-    about = About.query.first()
+    about = load_about()
     if not about:
         about = About()
         db.session.add(about)
+        cache.delete_memoized(about_id)
     
-    # Basic Info
-    about.name = request.form.get('name')
-    about.birthday = request.form.get('birthday')
-    about.website = request.form.get('website')
-    about.phone = request.form.get('phone')
-    about.city = request.form.get('city')
-    about.age = request.form.get('age')
-    about.degree = request.form.get('degree')
-    about.email = request.form.get('email')
-    about.freelance_status = request.form.get('freelance_status')
-    about.short_bio = request.form.get('short_bio')
-    about.long_bio = request.form.get('long_bio')
-
-    # --- NEW FIELD HANDLING ---
-    about.daily_update = request.form.get('daily_update')
-    
-    # Social Links
-    about.github = request.form.get('github')
-    about.facebook = request.form.get('facebook')
-    about.linkedin = request.form.get('linkedin')
-    about.whatsapp = request.form.get('whatsapp')
-    about.instagram = request.form.get('instagram')
-    about.twitter = request.form.get('twitter')
+    # Basic info, daily update and social links come straight from the form.
+    # SQLAlchemy only writes the columns whose values actually changed.
+    form = request.form
+    for field in ABOUT_FORM_FIELDS:
+        setattr(about, field, form.get(field))
     
-    # Resume
-    if request.form.get('resume_link'):
-        about.resume_link = request.form.get('resume_link')
-        
-    if 'resume_file' in request.files:
-        url = handle_file_upload(request.files['resume_file'], subfolder='resumes')
-        if url: about.resume_link = url
-
-    # 1. Main Profile Image
-    if request.form.get('profile_image'):
-        about.profile_image = request.form.get('profile_image')
-    
-    if 'image_file' in request.files:
-        url = handle_file_upload(request.files['image_file'], subfolder='profile')
-        if url: about.profile_image = url
-
-    # 2. Mini Profile Image 
-    if request.form.get('mini_profile_image'):
-        about.mini_profile_image = request.form.get('mini_profile_image')
-    
-    if 'mini_image_file' in request.files:
-        url = handle_file_upload(request.files['mini_image_file'], subfolder='profile')
-        if url: about.mini_profile_image = url
+    # Resume, main and mini profile images: only overwritten when a new
+    # link or file is given
+    files = {}
+    bind_upload(files, 'resume_link', 'resume_file', 'resumes', form_key='resume_link')
+    bind_upload(files, 'profile_image', 'image_file', 'profile', form_key='profile_image')
+    bind_upload(files, 'mini_profile_image', 'mini_image_file', 'profile', form_key='mini_profile_image')
+    previous = {field: getattr(about, field) for field in files}
+    for field, value in files.items():
+        setattr(about, field, value)
     
     db.session.commit()
+    start_uploads(About, about.id, files, previous)
+    cache.delete('api_about')
+    cache.delete_memoized(load_image_history)
     flash('About section updated!')
     return redirect(url_for('dashboard', tab='about'))
 
-
 @app.route('/add/skill', methods=['POST'])
 @login_required
 def add_skill():
-    image_url = None
-    if 'image_file' in request.files:
-        url = handle_file_upload(request.files['image_file'], subfolder='skills')
-        if url: image_url = url
-
-    new_skill = Skill(
-        name=request.form['name'], 
-        percentage=request.form['percentage'],
-        image_url=image_url
-    )
+    values = {field: request.form[field] for field in SKILL_FIELDS}
+    bind_upload(values, 'image_url', 'image_file', 'skills')
+
+    new_skill = Skill(**values)
     db.session.add(new_skill)
     db.session.commit()
+    start_uploads(Skill, new_skill.id, values)
+    cache.delete('api_skills')
     return redirect(url_for('dashboard', tab='skills'))
 
 @app.route('/edit/skill/<int:id>', methods=['POST'])
 @login_required
 def edit_skill(id):
-    skill = Skill.query.get_or_404(id)
-    skill.name = request.form['name']
-    skill.percentage = request.form['percentage']
-    
-    if 'image_file' in request.files:
-        url = handle_file_upload(request.files['image_file'], subfolder='skills')
-        if url: skill.image_url = url
+    values = {field: request.form[field] for field in SKILL_FIELDS}
+    bind_upload(values, 'image_url', 'image_file', 'skills')
 
-    db.session.commit()
-    flash('Skill updated successfully!')
-    return redirect(url_for('dashboard', tab='skills'))
+    return update_by_id(Skill, id, values, 'skills', 'api_skills', 'Skill updated successfully!')
 
 @app.route('/delete/skill/<int:id>')
 @login_required
 def delete_skill(id):
-    Skill.query.filter_by(id=id).delete()
-    db.session.commit()
-    return redirect(url_for('dashboard', tab='skills'))
+    return delete_by_id(Skill, id, 'skills', 'api_skills')
 
 @app.route('/add/education', methods=['POST'])
 @login_required
 def add_education():
-    logo_url = None
-    # Handle Logo Upload
-    if 'logo_file' in request.files:
-        url = handle_file_upload(request.files['logo_file'], subfolder='education')
-        if url: logo_url = url
-
-    new_edu = Education(
-        degree=request.form['degree'],
-        institution=request.form['institution'],
-        logo_url=logo_url,
-        year_range=request.form['year_range'],
-        description=request.form['description']
-    )
+    values = {field: request.form[field] for field in EDUCATION_FIELDS}
+    bind_upload(values, 'logo_url', 'logo_file', 'education')
+
+    new_edu = Education(**values)
     db.session.add(new_edu)
     db.session.commit()
+    start_uploads(Education, new_edu.id, values)
+    cache.delete('api_education')
     return redirect(url_for('dashboard', tab='education'))
 
 @app.route('/edit/education/<int:id>', methods=['POST'])
 @login_required
 def edit_education(id):
-    edu = Education.query.get_or_404(id)
-    edu.degree = request.form['degree']
-    edu.institution = request.form['institution']
-    edu.year_range = request.form['year_range']
-    edu.description = request.form['description']
-    
-    # Handle Logo Update
-    if 'logo_file' in request.files:
-         url = handle_file_upload(request.files['logo_file'], subfolder='education')
-         if url: edu.logo_url = url
-         
-    db.session.commit()
-    flash('Education updated successfully!')
-    return redirect(url_for('dashboard', tab='education'))
+    values = {field: request.form[field] for field in EDUCATION_FIELDS}
+    bind_upload(values, 'logo_url', 'logo_file', 'education')
+
+    return update_by_id(Education, id, values, 'education', 'api_education', 'Education updated successfully!')
 
 @app.route('/delete/education/<int:id>')
 @login_required
 def delete_education(id):
-    Education.query.filter_by(id=id).delete()
-    db.session.commit()
-    return redirect(url_for('dashboard', tab='education'))
+    return delete_by_id(Education, id, 'education', 'api_education')
 
 @app.route('/add/experience', methods=['POST'])
 @login_required
@@ -387,114 +908,80 @@ def add_experience():
     )
     db.session.add(new_exp)
     db.session.commit()
+    cache.delete('api_experience')
     return redirect(url_for('dashboard', tab='experience'))
 
 @app.route('/delete/experience/<int:id>')
 @login_required
 def delete_experience(id):
-    Experience.query.filter_by(id=id).delete()
-    db.session.commit()
-    return redirect(url_for('dashboard', tab='experience'))
+    return delete_by_id(Experience, id, 'experience', 'api_experience')
 
 @app.route('/edit/experience/<int:id>', methods=['POST'])
 @login_required
 def edit_experience(id):
-    exp = Experience.query.get_or_404(id)
-    exp.role = request.form['role']
-    exp.company = request.form['company']
-    exp.year_range = request.form['year_range']
-    exp.description = request.form['description']
-    db.session.commit()
-    flash('Experience updated successfully!')
-    return redirect(url_for('dashboard', tab='experience'))
+    values = {field: request.form[field] for field in EXPERIENCE_FIELDS}
+    return update_by_id(Experience, id, values, 'experience', 'api_experience', 'Experience updated successfully!')
 
 @app.route('/add/project', methods=['POST'])
 @login_required
 def add_project():
-    image_url = request.form.get('image_url')
-    
-    if 'image_file' in request.files:
-        uploaded_url = handle_file_upload(request.files['image_file'], subfolder='projects')
-        if uploaded_url: image_url = uploaded_url
+    values = {field: request.form[field] for field in PROJECT_FIELDS}
+    bind_upload(values, 'image_url', 'image_file', 'projects', form_key='image_url')
 
-    new_proj = Project(
-        title=request.form['title'],
-        category=request.form['category'],
-        image_url=image_url,
-        project_link=request.form['project_link']
-    )
+    new_proj = Project(**values)
     db.session.add(new_proj)
     db.session.commit()
+    start_uploads(Project, new_proj.id, values)
+    cache.delete('api_projects')
+    cache.delete_memoized(load_image_history)
     return redirect(url_for('dashboard', tab='projects'))
 
 @app.route('/delete/project/<int:id>')
 @login_required
 def delete_project(id):
-    Project.query.filter_by(id=id).delete()
-    db.session.commit()
-    return redirect(url_for('dashboard', tab='projects'))
+    response = delete_by_id(Project, id, 'projects', 'api_projects')
+    cache.delete_memoized(load_image_history)
+    return response
 
 @app.route('/edit/project/<int:id>', methods=['POST'])
 @login_required
 def edit_project(id):
-    proj = Project.query.get_or_404(id)
-    proj.title = request.form['title']
-    proj.category = request.form['category']
-    proj.project_link = request.form['project_link']
-    
-    if request.form.get('image_url'):
-        proj.image_url = request.form.get('image_url')
-        
-    if 'image_file' in request.files:
-        uploaded_url = handle_file_upload(request.files['image_file'], subfolder='projects')
-        if uploaded_url: proj.image_url = uploaded_url
+    values = {field: request.form[field] for field in PROJECT_FIELDS}
+    bind_upload(values, 'image_url', 'image_file', 'projects', form_key='image_url')
 
-    db.session.commit()
-    flash('Project updated successfully!')
-    return redirect(url_for('dashboard', tab='projects'))
+    response = update_by_id(Project, id, values, 'projects', 'api_projects', 'Project updated successfully!')
+    cache.delete_memoized(load_image_history)
+    return response
 
 @app.route('/add/research', methods=['POST'])
 @login_required
 def add_research():
-    link = request.form.get('link')
-
-    if 'research_pdf' in request.files:
-        uploaded_link = handle_file_upload(request.files['research_pdf'], subfolder='research')
-        if uploaded_link: link = uploaded_link
-
-    new_research = Research(
-        title=request.form['title'],
-        description=request.form['description'],
-        link=link,
-        publication_date=request.form['publication_date']
-    )
+    values = {
+        'title': request.form['title'],
+        'description': request.form['description'],
+        'publication_date': request.form['publication_date']
+    }
+    bind_upload(values, 'link', 'research_pdf', 'research', form_key='link')
+
+    new_research = Research(**values)
     db.session.add(new_research)
     db.session.commit()
+    start_uploads(Research, new_research.id, values)
+    cache.delete('api_research')
     return redirect(url_for('dashboard', tab='research'))
 
 @app.route('/delete/research/<int:id>')
 @login_required
 def delete_research(id):
-    Research.query.filter_by(id=id).delete()
-    db.session.commit()
-    return redirect(url_for('dashboard', tab='research'))
+    return delete_by_id(Research, id, 'research', 'api_research')
 
 @app.route('/edit/research/<int:id>', methods=['POST'])
 @login_required
 def edit_research(id):
-    research = Research.query.get_or_404(id)
-    research.title = request.form['title']
-    research.publication_date = request.form['publication_date']
-    research.link = request.form['link']
-    research.description = request.form['description']
-    
-    if 'research_pdf' in request.files:
-        uploaded_link = handle_file_upload(request.files['research_pdf'], subfolder='research')
-        if uploaded_link: research.link = uploaded_link
+    values = {field: request.form[field] for field in RESEARCH_FIELDS}
+    bind_upload(values, 'link', 'research_pdf', 'research')
 
-    db.session.commit()
-    flash('Research updated successfully!')
-    return redirect(url_for('dashboard', tab='research'))
+    return update_by_id(Research, id, values, 'research', 'api_research', 'Research updated successfully!')
 
 # --- ACHIEVEMENT ROUTES ---
 
@@ -509,71 +996,47 @@ def add_achievement():
     )
     db.session.add(new_ach)
     db.session.commit()
+    cache.delete('api_achievements')
     return redirect(url_for('dashboard', tab='achievements'))
 
 @app.route('/delete/achievement/<int:id>')
 @login_required
 def delete_achievement(id):
-    Achievement.query.filter_by(id=id).delete()
-    db.session.commit()
-    return redirect(url_for('dashboard', tab='achievements'))
+    return delete_by_id(Achievement, id, 'achievements', 'api_achievements')
 
 @app.route('/edit/achievement/<int:id>', methods=['POST'])
 @login_required
 def edit_achievement(id):
-    ach = Achievement.query.get_or_404(id)
-    ach.title = request.form['title']
-    ach.description = request.form['description']
-    ach.date = request.form['date']
-    ach.link = request.form['link']
-    db.session.commit()
-    flash('Achievement updated successfully!')
-    return redirect(url_for('dashboard', tab='achievements'))
+    values = {field: request.form[field] for field in ACHIEVEMENT_FIELDS}
+    return update_by_id(Achievement, id, values, 'achievements', 'api_achievements', 'Achievement updated successfully!')
 
 
 # BLOG 
 @app.route('/add/blog', methods=['POST'])
 @login_required
 def add_blog():
-    cover_image = None
-    if 'cover_file' in request.files:
-        url = handle_file_upload(request.files['cover_file'], subfolder='blog')
-        if url: cover_image = url
+    values = {field: request.form[field] for field in BLOG_FIELDS}
+    bind_upload(values, 'cover_image', 'cover_file', 'blog')
 
-    new_blog = Blog(
-        title=request.form['title'],
-        content=request.form['content'],
-        tags=request.form['tags'],
-        date=request.form['date'],
-        cover_image=cover_image
-    )
+    new_blog = Blog(**values)
     db.session.add(new_blog)
     db.session.commit()
+    start_uploads(Blog, new_blog.id, values)
+    cache.delete('api_blogs')
     return redirect(url_for('dashboard', tab='blog'))
 
 @app.route('/delete/blog/<int:id>')
 @login_required
 def delete_blog(id):
-    Blog.query.filter_by(id=id).delete()
-    db.session.commit()
-    return redirect(url_for('dashboard', tab='blog'))
+    return delete_by_id(Blog, id, 'blog', 'api_blogs')
 
 @app.route('/edit/blog/<int:id>', methods=['POST'])
 @login_required
 def edit_blog(id):
-    blog = Blog.query.get_or_404(id)
-    blog.title = request.form['title']
-    blog.content = request.form['content']
-    blog.tags = request.form['tags']
-    blog.date = request.form['date']
-    
-    if 'cover_file' in request.files:
-        url = handle_file_upload(request.files['cover_file'], subfolder='blog')
-        if url: blog.cover_image = url
+    values = {field: request.form[field] for field in BLOG_FIELDS}
+    bind_upload(values, 'cover_image', 'cover_file', 'blog')
 
-    db.session.commit()
-    flash('Blog updated successfully!')
-    return redirect(url_for('dashboard', tab='blog'))
+    return update_by_id(Blog, id, values, 'blog', 'api_blogs', 'Blog updated successfully!')
 
 # --- DAILY UPDATE ROUTES (NEW) ---
 
@@ -587,77 +1050,72 @@ def add_daily_update():
     )
     db.session.add(new_update)
     db.session.commit()
+    cache.delete('api_daily_updates')
     return redirect(url_for('dashboard', tab='daily_updates'))
 
 @app.route('/edit/daily_update/<int:id>', methods=['POST'])
 @login_required
 def edit_daily_update(id):
-    update = DailyUpdate.query.get_or_404(id)
-    update.title = request.form['title']
-    update.date = request.form['date']
-    update.description = request.form['description']
-    db.session.commit()
-    flash('Daily update modified successfully!')
-    return redirect(url_for('dashboard', tab='daily_updates'))
+    values = {field: request.form[field] for field in DAILY_UPDATE_FIELDS}
+    return update_by_id(DailyUpdate, id, values, 'daily_updates', 'api_daily_updates', 'Daily update modified successfully!')
 
 @app.route('/delete/daily_update/<int:id>')
 @login_required
 def delete_daily_update(id):
-    DailyUpdate.query.filter_by(id=id).delete()
-    db.session.commit()
-    return redirect(url_for('dashboard', tab='daily_updates'))
+    return delete_by_id(DailyUpdate, id, 'daily_updates', 'api_daily_updates')
 
 # --- PUBLIC API ENDPOINTS ---
 
 @app.route('/api/about', methods=['GET'])
+@cached_api('api_about')
 def get_about():
-    about = About.query.first()
-    return jsonify(about.to_dict() if about else {})
+    rows = fetch_rows(About, About.API_FIELDS, limit=1)
+    return rows[0] if rows else {}
 
 @app.route('/api/skills', methods=['GET'])
+@cached_api('api_skills')
 def get_skills():
-    skills = Skill.query.all()
-    return jsonify([s.to_dict() for s in skills])
+    return fetch_rows(Skill, Skill.API_FIELDS)
 
 @app.route('/api/education', methods=['GET'])
+@cached_api('api_education')
 def get_education():
-    education = Education.query.all()
-    return jsonify([e.to_dict() for e in education])
+    return fetch_rows(Education, Education.API_FIELDS)
 
 @app.route('/api/experience', methods=['GET'])
+@cached_api('api_experience')
 def get_experience():
-    experience = Experience.query.all()
-    return jsonify([e.to_dict() for e in experience])
+    return fetch_rows(Experience, Experience.API_FIELDS)
 
 @app.route('/api/projects', methods=['GET'])
+@cached_api('api_projects')
 def get_projects():
-    projects = Project.query.all()
-    return jsonify([p.to_dict() for p in projects])
+    return fetch_rows(Project, Project.API_FIELDS)
 
 @app.route('/api/research', methods=['GET'])
+@cached_api('api_research')
 def get_research():
-    research = Research.query.all()
-    return jsonify([t.to_dict() for t in research])
+    return fetch_rows(Research, Research.API_FIELDS)
 
 @app.route('/api/achievements', methods=['GET'])
+@cached_api('api_achievements')
 def get_achievements():
-    achievements = Achievement.query.all()
-    return jsonify([a.to_dict() for a in achievements])
+    return fetch_rows(Achievement, Achievement.API_FIELDS)
 
 @app.route('/api/blogs', methods=['GET'])
+@cached_api('api_blogs')
 def get_blogs():
-    blogs = Blog.query.all()
-    return jsonify([b.to_dict() for b in blogs])
+    return fetch_rows(Blog, Blog.API_FIELDS)
 
 @app.route('/api/daily_updates', methods=['GET'])
+@cached_api('api_daily_updates')
 def get_daily_updates():
-    updates = DailyUpdate.query.order_by(DailyUpdate.id.desc()).all()
-    return jsonify([u.to_dict() for u in updates])
+    return fetch_rows(DailyUpdate, DailyUpdate.API_FIELDS, order_by=DailyUpdate.id.desc())
 
 @app.route('/api/contact', methods=['POST'])
 def api_contact():
     data = request.json or request.form
-    if not data: return jsonify({"error": "No data provided"}), 400
+    if not data: return json_response({"error": "No data provided"}, 400)
     new_msg = ContactMessage(
         name=data.get('name'),
         email=data.get('email'),
@@ -666,7 +1124,8 @@ def api_contact():
     )
     db.session.add(new_msg)
     db.session.commit()
-    return jsonify({"success": True, "message": "Message sent successfully!"}), 201
+    adjust_unread_count(1)
+    return json_response({"success": True, "message": "Message sent successfully!"}, 201)
 
 if __name__ == '__main__':
     app.run(debug=True)
\ No newline at end of file
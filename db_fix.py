@@ -1,11 +1,12 @@
 import sqlalchemy
-from app import app, db
+from app import app, db, REDIS_URL, seed_unread_count
 from sqlalchemy import text
 
 def fix_database():
     """
     1. Creates new tables (like DailyUpdate).
     2. Manually adds missing columns to existing tables (like 'about').
+    3. Creates indexes that were added to existing tables.
     """
     print("🔧 Starting Database Fix...")
     
@@ -15,34 +16,93 @@ def fix_database():
         db.create_all()
         print("   ✅ New tables created (if any were missing).")
 
-        # 2. Add missing columns to 'about' table
+        # 2. Add missing columns to existing tables
         # Since db.create_all() DOES NOT update existing tables, we do this manually.
-        print("   - Checking 'about' table for missing columns...")
-        
         inspector = sqlalchemy.inspect(db.engine)
-        columns = [col['name'] for col in inspector.get_columns('about')]
         
-        # List of new columns we added to models.py: (column_name, sql_type)
-        new_columns = [
-            ('daily_update', 'TEXT'),
-            ('mini_profile_image', 'VARCHAR(255)'),
-            ('resume_link', 'VARCHAR(255)')
-        ]
+        # List of new columns we added to models.py, per table: (column_name, sql_type)
+        new_columns = {
+            'about': [
+                ('daily_update', 'TEXT'),
+                ('mini_profile_image', 'VARCHAR(255)'),
+                ('resume_link', 'VARCHAR(255)')
+            ],
+            'user': [
+                ('password_hash', 'VARCHAR(255)'),
+                ('password_verified_at', 'TIMESTAMP')
+            ]
+        }
 
-        with db.engine.connect() as conn:
-            for col_name, col_type in new_columns:
+        # Collect every missing column first (one inspector lookup per table)...
+        missing = []
+        for table, table_columns in new_columns.items():
+            print(f"   - Checking '{table}' table for missing columns...")
+            columns = {col['name'] for col in inspector.get_columns(table)}
+
+            for col_name, col_type in table_columns:
                 if col_name not in columns:
-                    print(f"     -> Adding missing column: {col_name} ({col_type})")
-                    try:
-                        # ALTER TABLE command works for both SQLite and PostgreSQL
-                        conn.execute(text(f'ALTER TABLE about ADD COLUMN {col_name} {col_type}'))
-                        conn.commit()
-                        print(f"     ✅ Added {col_name}")
-                    except Exception as e:
-                        print(f"     ❌ Error adding {col_name}: {e}")
+                    print(f"     -> Missing column: {col_name} ({col_type})")
+                    missing.append((table, col_name, col_type))
                 else:
                     print(f"     - {col_name} already exists.")
 
+        # ...then add them all in a single transaction
+        if missing:
+            try:
+                with db.engine.begin() as conn:
+                    for table, col_name, col_type in missing:
+                        # ALTER TABLE command works for both SQLite and PostgreSQL
+                        # ("user" is quoted because it is a reserved word in PostgreSQL)
+                        conn.execute(text(f'ALTER TABLE "{table}" ADD COLUMN {col_name} {col_type}'))
+                print(f"   ✅ Added {len(missing)} column(s).")
+            except Exception as e:
+                print(f"   ❌ Error adding columns (none were added): {e}")
+
+        # 3. Create indexes declared in models.py (create_all() skips them on existing tables)
+        print("   - Checking contact_message indexes...")
+        # CONCURRENTLY keeps the table writable while building, but cannot run in a transaction
+        concurrently = 'CONCURRENTLY ' if db.engine.dialect.name == 'postgresql' else ''
+        indexes = [
+            f'CREATE INDEX {concurrently}IF NOT EXISTS ix_contactmessage_timestamp_desc '
+            f'ON contact_message (timestamp DESC)',
+            f'CREATE INDEX {concurrently}IF NOT EXISTS ix_contactmessage_unread '
+            f'ON contact_message (id) WHERE read = false'
+        ]
+        failed = 0
+        with db.engine.connect() as conn:
+            conn = conn.execution_options(isolation_level="AUTOCOMMIT")
+            if concurrently:
+                # Direct connections carry a 5s statement_timeout; a concurrent build cut
+                # short leaves an INVALID index that IF NOT EXISTS would then skip forever
+                # (the 6543 pooler sets none, and a SET there would leak to other clients)
+                if db.engine.url.port != 6543:
+                    conn.execute(text("SET statement_timeout = 0"))
+                invalid = conn.execute(text(
+                    "SELECT c.relname FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid "
+                    "WHERE NOT i.indisvalid AND c.relname IN "
+                    "('ix_contactmessage_timestamp_desc', 'ix_contactmessage_unread')"
+                )).scalars().all()
+                for name in invalid:
+                    print(f"     -> Dropping invalid index left by an earlier run: {name}")
+                    conn.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {name}"))
+            for statement in indexes:
+                try:
+                    conn.execute(text(statement))
+                except Exception as e:
+                    failed += 1
+                    print(f"     ❌ Error creating index: {e}")
+        if failed:
+            print(f"   ❌ {failed} index(es) could not be created.")
+        else:
+            print("   ✅ Indexes in place.")
+
+        # 4. Seed the unread-message counter in Redis (kept up to date by the app).
+        # Without Redis the app counts in the database instead.
+        if REDIS_URL:
+            print("   - Seeding unread message counter...")
+            unread = seed_unread_count()
+            print(f"   ✅ {unread} unread message(s).")
+
     print("\n🎉 Database migration finished!")
 
 if __name__ == "__main__":
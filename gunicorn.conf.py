@@ -0,0 +1,13 @@
+import os
+
+# gevent workers: one process serves many requests while they wait on
+# Postgres and Supabase, instead of one request per thread.
+worker_class = 'gevent'
+workers = int(os.getenv('WEB_CONCURRENCY', 4))
+worker_connections = int(os.getenv('WORKER_CONNECTIONS', 1000))
+bind = f"0.0.0.0:{os.getenv('PORT', 8000)}"
+
+def post_fork(server, worker):
+    # Let psycopg2 yield to other greenlets while waiting on the network
+    from psycogreen.gevent import patch_psycopg
+    patch_psycopg()
@@ -4,14 +4,23 @@ from datetime import datetime
 
 db = SQLAlchemy()
 
+class ApiFieldsMixin:
+    """to_dict() over API_FIELDS, the columns the public API returns, in response order."""
+    API_FIELDS = ()
+
+    def to_dict(self):
+        return {field: getattr(self, field) for field in self.API_FIELDS}
+
 # Admin User Model (Updated for Email Auth)
 class User(UserMixin, db.Model):
     id = db.Column(db.Integer, primary_key=True)
     email = db.Column(db.String(150), unique=True, nullable=False)
     password = db.Column(db.String(150), nullable=False)
+    password_hash = db.Column(db.String(255)) # Cached after a successful Supabase login
+    password_verified_at = db.Column(db.DateTime) # When Supabase last accepted password_hash
 
 # About Me Section
-class About(db.Model):
+class About(ApiFieldsMixin, db.Model):
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(100))
     birthday = db.Column(db.String(50))
@@ -42,48 +51,27 @@ class About(db.Model):
     instagram = db.Column(db.String(255))
     twitter = db.Column(db.String(255))
 
-    def to_dict(self):
-        return {
-            'name': self.name,
-            'birthday': self.birthday,
-            'website': self.website,
-            'phone': self.phone,
-            'city': self.city,
-            'age': self.age,
-            'degree': self.degree,
-            'email': self.email,
-            'freelance_status': self.freelance_status,
-            'short_bio': self.short_bio,
-            'long_bio': self.long_bio,
-            'daily_update': self.daily_update, # <--- Added to API response
-            'profile_image': self.profile_image,
-            'mini_profile_image': self.mini_profile_image, 
-            'resume_link': self.resume_link,
-            'github': self.github,
-            'facebook': self.facebook,
-            'linkedin': self.linkedin,
-            'whatsapp': self.whatsapp,
-            'instagram': self.instagram,
-            'twitter': self.twitter
-        }
+    API_FIELDS = (
+        'name', 'birthday', 'website', 'phone', 'city', 'age', 'degree', 'email',
+        'freelance_status', 'short_bio', 'long_bio', 'daily_update',
+        'profile_image', 'mini_profile_image', 'resume_link',
+        'github', 'facebook', 'linkedin', 'whatsapp', 'instagram', 'twitter'
+    )
+
+    # Filled from uploads or typed links, never assigned from the form as-is
+    UPLOAD_FIELDS = ('profile_image', 'mini_profile_image', 'resume_link')
 
 # Skills Section
-class Skill(db.Model):
+class Skill(ApiFieldsMixin, db.Model):
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(50), nullable=False)
     percentage = db.Column(db.Integer, nullable=False) 
     image_url = db.Column(db.String(255)) 
 
-    def to_dict(self):
-        return {
-            'id': self.id,
-            'name': self.name,
-            'percentage': self.percentage,
-            'image_url': self.image_url 
-        }
+    API_FIELDS = ('id', 'name', 'percentage', 'image_url')
 
 # Education Section
-class Education(db.Model):
+class Education(ApiFieldsMixin, db.Model):
     id = db.Column(db.Integer, primary_key=True)
     degree = db.Column(db.String(100), nullable=False)
     institution = db.Column(db.String(100), nullable=False)
@@ -91,86 +79,50 @@ class Education(db.Model):
     year_range = db.Column(db.String(50))
     description = db.Column(db.Text)
 
-    def to_dict(self):
-        return {
-            'id': self.id,
-            'degree': self.degree,
-            'institution': self.institution,
-            'logo_url': self.logo_url, 
-            'year_range': self.year_range,
-            'description': self.description
-        }
+    API_FIELDS = ('id', 'degree', 'institution', 'logo_url', 'year_range', 'description')
 
 # Experience Section
-class Experience(db.Model):
+class Experience(ApiFieldsMixin, db.Model):
     id = db.Column(db.Integer, primary_key=True)
     role = db.Column(db.String(100), nullable=False)
     company = db.Column(db.String(100), nullable=False)
     year_range = db.Column(db.String(50))
     description = db.Column(db.Text)
 
-    def to_dict(self):
-        return {
-            'id': self.id,
-            'role': self.role,
-            'company': self.company,
-            'year_range': self.year_range,
-            'description': self.description
-        }
+    API_FIELDS = ('id', 'role', 'company', 'year_range', 'description')
 
 # Projects Section
-class Project(db.Model):
+class Project(ApiFieldsMixin, db.Model):
     id = db.Column(db.Integer, primary_key=True)
     title = db.Column(db.String(100), nullable=False)
     category = db.Column(db.String(50)) 
     image_url = db.Column(db.String(255))
     project_link = db.Column(db.String(255))
 
-    def to_dict(self):
-        return {
-            'id': self.id,
-            'title': self.title,
-            'category': self.category,
-            'image_url': self.image_url,
-            'project_link': self.project_link
-        }
+    API_FIELDS = ('id', 'title', 'category', 'image_url', 'project_link')
 
 # Research Section
-class Research(db.Model):
+class Research(ApiFieldsMixin, db.Model):
     id = db.Column(db.Integer, primary_key=True)
     title = db.Column(db.String(200), nullable=False)
     description = db.Column(db.Text)
     link = db.Column(db.String(255))
     publication_date = db.Column(db.String(50))
 
-    def to_dict(self):
-        return {
-            'id': self.id,
-            'title': self.title,
-            'description': self.description,
-            'link': self.link,
-            'publication_date': self.publication_date
-        }
+    API_FIELDS = ('id', 'title', 'description', 'link', 'publication_date')
     
 # Achievements Section
-class Achievement(db.Model):
+class Achievement(ApiFieldsMixin, db.Model):
     id = db.Column(db.Integer, primary_key=True)
     title = db.Column(db.String(200), nullable=False)
     description = db.Column(db.Text)
     date = db.Column(db.String(50)) 
     link = db.Column(db.String(255)) 
 
-    def to_dict(self):
-        return {
-            'id': self.id,
-            'title': self.title,
-            'description': self.description,
-            'date': self.date,
-            'link': self.link
-        }
+    API_FIELDS = ('id', 'title', 'description', 'date', 'link')
     
 # Blog Section
-class Blog(db.Model):
+class Blog(ApiFieldsMixin, db.Model):
     id = db.Column(db.Integer, primary_key=True)
     title = db.Column(db.String(200), nullable=False)
     content = db.Column(db.Text, nullable=False)
@@ -178,30 +130,16 @@ class Blog(db.Model):
     tags = db.Column(db.String(200)) 
     date = db.Column(db.String(50)) 
 
-    def to_dict(self):
-        return {
-            'id': self.id,
-            'title': self.title,
-            'content': self.content,
-            'cover_image': self.cover_image,
-            'tags': self.tags,
-            'date': self.date
-        }
+    API_FIELDS = ('id', 'title', 'content', 'cover_image', 'tags', 'date')
 
 # Daily Updates Section (NEW)
-class DailyUpdate(db.Model):
+class DailyUpdate(ApiFieldsMixin, db.Model):
     id = db.Column(db.Integer, primary_key=True)
     title = db.Column(db.String(200), nullable=False)
     date = db.Column(db.String(50))
     description = db.Column(db.Text)
 
-    def to_dict(self):
-        return {
-            'id': self.id,
-            'title': self.title,
-            'date': self.date,
-            'description': self.description
-        }
+    API_FIELDS = ('id', 'title', 'date', 'description')
 
 # Contact Messages
 class ContactMessage(db.Model):
@@ -213,6 +151,15 @@ class ContactMessage(db.Model):
     timestamp = db.Column(db.DateTime, default=datetime.utcnow)
     read = db.Column(db.Boolean, default=False)
 
+    __table_args__ = (
+        # Inbox ordering on the dashboard
+        db.Index('ix_contactmessage_timestamp_desc', timestamp.desc()),
+        # Partial index: only unread rows, so the unread count stays tiny
+        # (same "read = false" predicate the queries use, so the planner can match it)
+        db.Index('ix_contactmessage_unread', 'id',
+                 postgresql_where=read == False, sqlite_where=read == False),
+    )
+
     def to_dict(self):
         return {
             'id': self.id,
@@ -222,4 +169,9 @@ class ContactMessage(db.Model):
             'message': self.message,
             'timestamp': self.timestamp.isoformat(),
             'read': self.read
-        }
\ No newline at end of file
+        }
+
+# One-time setup markers (e.g. 'bootstrap_done' once create-admin has run)
+class SystemFlag(db.Model):
+    key = db.Column(db.String(50), primary_key=True)
+    value = db.Column(db.String(255))
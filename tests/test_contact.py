@@ -0,0 +1,65 @@
+import os
+import unittest
+from unittest import mock
+
+# Never point the tests at a real database or cache
+os.environ['DATABASE_URL'] = 'sqlite://'
+os.environ.pop('REDIS_URL', None)
+os.environ.setdefault('SUPABASE_URL', 'https://example.supabase.co')
+os.environ.setdefault('SUPABASE_KEY', 'test-key')
+
+from app import app, db, cache, unread_count, UNREAD_COUNT_KEY
+
+try:
+    # fakeredis needs lupa to run the counter's Lua script
+    import fakeredis
+    import lupa
+except ImportError:
+    fakeredis = None
+
+
+class ContactMessageTest(unittest.TestCase):
+    def setUp(self):
+        app.config.update(TESTING=True, LOGIN_DISABLED=True)
+        self.client = app.test_client()
+        with app.app_context():
+            db.create_all()
+            cache.clear()
+
+    def tearDown(self):
+        with app.app_context():
+            db.drop_all()
+
+    def post_then_mark_read(self):
+        with app.app_context():
+            self.assertEqual(unread_count(), 0)
+
+        res = self.client.post('/api/contact', json={
+            'name': 'Ada',
+            'email': 'ada@example.com',
+            'subject': 'Hello',
+            'message': 'Hi there'
+        })
+        self.assertEqual(res.status_code, 201)
+        with app.app_context():
+            self.assertEqual(unread_count(), 1)
+
+        res = self.client.post('/api/message/read/1')
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(res.get_json(), {'success': True, 'unread_count': 0})
+
+    def test_post_then_mark_read_without_redis(self):
+        self.post_then_mark_read()
+
+    @unittest.skipUnless(fakeredis, "fakeredis[lua] is not installed")
+    def test_post_then_mark_read_with_redis(self):
+        redis = fakeredis.FakeRedis()
+        with mock.patch('app.get_counter_redis', return_value=redis):
+            # unread_count() seeds the counter, so posting and reading adjust it in place
+            self.post_then_mark_read()
+        self.assertEqual(int(redis.get(UNREAD_COUNT_KEY)), 0)
+        self.assertGreater(redis.ttl(UNREAD_COUNT_KEY), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()